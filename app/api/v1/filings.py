@@ -1,33 +1,45 @@
-from fastapi import APIRouter, Depends
-from typing import Dict, Any
+from fastapi import APIRouter, Depends, Header, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
 
-from ...core.deps import get_consumer_info
+from ...core.config import APISIX_CONSUMER_HEADER, APISIX_USER_ID_HEADER
+from ...core.deps import get_db
+from ...schemas.filing import Filing
+from ...schemas.response import ListResponse
+from ...services.filing_service import FilingService
 
 router = APIRouter()
 
 
-@router.get("/filings")
+@router.get("/filings", response_model=ListResponse[Filing])
 async def list_filings(
-    consumer_info: Dict[str, Any] = Depends(get_consumer_info)
+    page: int = Query(1, ge=1),
+    per_page: int = Query(100, ge=1, le=500),
+    db: AsyncSession = Depends(get_db)
 ):
     """List regulatory filings"""
+    service = FilingService(db)
+    items, total = await service.get_filings_page(
+        skip=(page - 1) * per_page, limit=per_page
+    )
     return {
-        "filings": [],
-        "consumer": consumer_info.get("consumer"),
-        "user_id": consumer_info.get("user_id"),
-        "message": "Filings endpoint - ready for implementation"
+        "items": items,
+        "total": total,
+        "page": page,
+        "per_page": per_page
     }
 
 
 @router.get("/filings/{filing_id}")
 async def get_filing(
     filing_id: str,
-    consumer_info: Dict[str, Any] = Depends(get_consumer_info)
+    consumer: Optional[str] = Header(None, alias=APISIX_CONSUMER_HEADER),
+    user_id: Optional[str] = Header(None, alias=APISIX_USER_ID_HEADER)
 ):
     """Get specific regulatory filing"""
     return {
         "filing_id": filing_id,
-        "consumer": consumer_info.get("consumer"),
-        "user_id": consumer_info.get("user_id"),
+        "consumer": consumer,
+        "user_id": user_id,
         "message": "Filing detail endpoint - ready for implementation"
-    }
\ No newline at end of file
+    }
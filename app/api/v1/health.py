@@ -1,40 +1,44 @@
 from fastapi import APIRouter, Depends
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import text
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.ext.asyncio import AsyncEngine
 
-from ...core.deps import get_db
+from ...core.deps import get_engine
 from ...core.config import settings
+from ...schemas.response import HealthResponse
 
 router = APIRouter()
 
+# Service identity never changes for the life of the process
+_SERVICE_INFO = {
+    "service": settings.app_name,
+    "version": settings.version
+}
+# Encoded once; returned as-is so liveness probes skip serialization
+_HEALTH_RESPONSE = ORJSONResponse({"status": "healthy", **_SERVICE_INFO})
 
-@router.get("/health")
+
+@router.get("/health", response_model=HealthResponse)
 async def health_check():
     """Basic health check endpoint"""
-    return {
-        "status": "healthy",
-        "service": settings.app_name,
-        "version": settings.version
-    }
+    return _HEALTH_RESPONSE
 
 
 @router.get("/health/ready")
-async def readiness_check(db: AsyncSession = Depends(get_db)):
+async def readiness_check(engine: AsyncEngine = Depends(get_engine)):
     """Readiness check with database connectivity"""
     try:
-        # Test database connection
-        await db.execute(text("SELECT 1"))
+        # Checkout pre-pings pooled connections (pool_pre_ping) or opens a new one
+        async with engine.connect():
+            pass
         return {
             "status": "ready",
-            "service": settings.app_name,
-            "version": settings.version,
+            **_SERVICE_INFO,
             "database": "connected"
         }
     except Exception as e:
         return {
             "status": "not ready",
-            "service": settings.app_name,
-            "version": settings.version,
+            **_SERVICE_INFO,
             "database": "disconnected",
             "error": str(e)
         }
\ No newline at end of file
@@ -5,6 +5,8 @@ from .filings import router as filings_router
 
 router = APIRouter()
 
-# Include sub-routers
+# Include sub-routers. include_router copies each route into the app's flat
+# route list with its full path compiled once, so nesting here adds no
+# per-request prefix matching (no Mount is created).
 router.include_router(health_router, tags=["health"])
 router.include_router(filings_router, prefix="/filings", tags=["filings"])
\ No newline at end of file
@@ -1,5 +1,6 @@
-from pydantic_settings import BaseSettings
-from typing import Optional
+from functools import lru_cache
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from typing import List, Optional
 
 
 class Settings(BaseSettings):
@@ -9,6 +10,12 @@ class Settings(BaseSettings):
 
     # Database
     database_url: Optional[str] = None
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: int = 30
+    db_pool_recycle: int = 1800
+    db_statement_cache_size: int = 256
+    db_pgbouncer: bool = False
 
     # APISIX Integration
     apisix_consumer_header: str = "X-Consumer-Username"
@@ -17,8 +24,19 @@ class Settings(BaseSettings):
     # API Settings
     api_v1_prefix: str = "/api/v1"
 
-    class Config:
-        env_file = ".env"
+    # CORS
+    cors_origins: List[str] = []
 
+    model_config = SettingsConfigDict(env_file=".env")
 
-settings = Settings()
\ No newline at end of file
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    return Settings()
+
+
+settings = get_settings()
+
+# Header aliases resolved once for use in request-time dependencies
+APISIX_CONSUMER_HEADER = settings.apisix_consumer_header
+APISIX_USER_ID_HEADER = settings.apisix_user_id_header
@@ -1,3 +1,6 @@
+from uuid import uuid4
+
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 from .config import settings
@@ -10,6 +13,34 @@ class Base(DeclarativeBase):
 engine = None
 async_session_maker = None
 
+# Shared by every sessionmaker so ad-hoc sessions match the app's configuration
+SESSION_OPTIONS = {"class_": AsyncSession, "expire_on_commit": False}
+
+
+def _connect_args() -> dict:
+    """Driver options controlling per-connection prepared statement caching.
+
+    asyncpg keeps prepared statements per connection, so repeated queries
+    skip server-side parsing and planning. PgBouncer in transaction mode can
+    hand each statement to a different backend, where those cached
+    statements do not exist; there both caches are disabled and statements
+    get unique names, leaving only SQLAlchemy's compiled-SQL cache.
+    """
+    if make_url(settings.database_url).get_driver_name() != "asyncpg":
+        return {}
+
+    if settings.db_pgbouncer:
+        return {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        }
+
+    return {
+        "statement_cache_size": settings.db_statement_cache_size,
+        "prepared_statement_cache_size": settings.db_statement_cache_size,
+    }
+
 
 def init_db():
     global engine, async_session_maker
@@ -20,12 +51,16 @@ def init_db():
     engine = create_async_engine(
         settings.database_url,
         echo=settings.debug,
-        future=True
+        future=True,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=True,
+        connect_args=_connect_args()
     )
 
-    async_session_maker = async_sessionmaker(
-        engine, class_=AsyncSession, expire_on_commit=False
-    )
+    async_session_maker = async_sessionmaker(engine, **SESSION_OPTIONS)
 
 
 async def get_db_session() -> AsyncSession:
@@ -33,7 +68,4 @@ async def get_db_session() -> AsyncSession:
         raise RuntimeError("Database not initialized. Call init_db() first.")
 
     async with async_session_maker() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
\ No newline at end of file
+        yield session
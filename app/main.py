@@ -1,11 +1,25 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 
 from .core.config import settings
-from .core.database import init_db
+from .core import database
 from .api.v1.router import router as api_v1_router
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Initialize database before the server accepts connections
+    if settings.database_url:
+        database.init_db()
+    yield
+    if database.engine:
+        await database.engine.dispose()
+
+
 def create_app() -> FastAPI:
     app = FastAPI(
         title=settings.app_name,
@@ -13,27 +27,30 @@ def create_app() -> FastAPI:
         openapi_url=f"{settings.api_v1_prefix}/openapi.json",
         docs_url=f"{settings.api_v1_prefix}/docs",
         redoc_url=f"{settings.api_v1_prefix}/redoc",
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan,
     )
 
-    # CORS middleware - configured for development
-    # TODO: Restrict origins for production
+    # CORS middleware - explicit allow-lists so header blocks are built once
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=["*"],
+        allow_origins=settings.cors_origins,
         allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
+        allow_methods=["GET", "POST", "PATCH", "DELETE"],
+        allow_headers=[
+            "Authorization",
+            "Content-Type",
+            settings.apisix_consumer_header,
+            settings.apisix_user_id_header,
+        ],
     )
 
+    # Compress only payloads large enough to benefit, e.g. filing listings
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
     # Include routers
     app.include_router(api_v1_router, prefix=settings.api_v1_prefix)
 
-    # Initialize database on startup
-    @app.on_event("startup")
-    async def startup_event():
-        if settings.database_url:
-            init_db()
-
     return app
 
 
@@ -1,4 +1,8 @@
-from sqlalchemy import Column, String, DateTime, Text, Integer
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import DDL, DateTime, FetchedValue, Text, event
+from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 
 from ..core.database import Base
@@ -6,12 +10,32 @@ from ..core.database import Base
 
 class Filing(Base):
     __tablename__ = "filings"
+    # Fetch server-generated columns via RETURNING so writes need no refresh
+    __mapper_args__ = {"eager_defaults": True}
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    filing_id: Mapped[str] = mapped_column(unique=True, index=True)
+    company_name: Mapped[str]
+    form_type: Mapped[str]
+    filing_date: Mapped[datetime]
+    content: Mapped[Optional[str]] = mapped_column(Text)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    # Maintained by the filings_moddatetime trigger below
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue()
+    )
+
 
-    id = Column(Integer, primary_key=True, index=True)
-    filing_id = Column(String, unique=True, index=True, nullable=False)
-    company_name = Column(String, nullable=False)
-    form_type = Column(String, nullable=False)
-    filing_date = Column(DateTime, nullable=False)
-    content = Column(Text)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
\ No newline at end of file
+event.listen(
+    Filing.__table__,
+    "after_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS moddatetime").execute_if(dialect="postgresql"),
+)
+event.listen(
+    Filing.__table__,
+    "after_create",
+    DDL(
+        "CREATE TRIGGER filings_moddatetime BEFORE UPDATE ON filings "
+        "FOR EACH ROW EXECUTE FUNCTION moddatetime(updated_at)"
+    ).execute_if(dialect="postgresql"),
+)
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from datetime import datetime
 from typing import Optional
 
@@ -12,10 +12,12 @@ class FilingBase(BaseModel):
 
 
 class FilingCreate(FilingBase):
-    pass
+    model_config = ConfigDict(extra="forbid")
 
 
 class FilingUpdate(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
     company_name: Optional[str] = None
     form_type: Optional[str] = None
     filing_date: Optional[datetime] = None
@@ -27,5 +29,4 @@ class Filing(FilingBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
@@ -1,10 +1,34 @@
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from typing import List, Optional
+import asyncio
 
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy import bindparam, select, func
+from typing import List, Optional, Tuple
+
+from ..core.database import SESSION_OPTIONS
 from ..models.filing import Filing
 from ..schemas.filing import FilingCreate, FilingUpdate
 
+# Statements are built once at import and parameterized per call
+_NEWEST_FIRST = (Filing.filing_date.desc(), Filing.id.desc())
+
+_GET_BY_FILING_ID = select(Filing).where(Filing.filing_id == bindparam("filing_id"))
+
+_LIST_FILINGS = (
+    select(Filing)
+    .order_by(*_NEWEST_FIRST)
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+
+_LIST_FILINGS_PAGE = (
+    select(Filing, func.count().over().label("total"))
+    .order_by(*_NEWEST_FIRST)
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+
+_COUNT_FILINGS = select(func.count()).select_from(Filing)
+
 
 class FilingService:
     def __init__(self, db: AsyncSession):
@@ -12,22 +36,56 @@ class FilingService:
 
     async def get_filing_by_id(self, filing_id: str) -> Optional[Filing]:
         """Get filing by filing_id"""
-        stmt = select(Filing).where(Filing.filing_id == filing_id)
-        result = await self.db.execute(stmt)
+        result = await self.db.execute(_GET_BY_FILING_ID, {"filing_id": filing_id})
         return result.scalar_one_or_none()
 
     async def get_filings(self, skip: int = 0, limit: int = 100) -> List[Filing]:
         """Get list of filings with pagination"""
-        stmt = select(Filing).offset(skip).limit(limit)
-        result = await self.db.execute(stmt)
+        result = await self.db.execute(_LIST_FILINGS, {"skip": skip, "limit": limit})
         return result.scalars().all()
 
+    async def get_filings_page(self, skip: int = 0, limit: int = 100) -> Tuple[List[Filing], int]:
+        """Get a page of filings together with the total count in one query"""
+        result = await self.db.execute(_LIST_FILINGS_PAGE, {"skip": skip, "limit": limit})
+        rows = result.all()
+        if rows:
+            return [row.Filing for row in rows], rows[0].total
+
+        # Window count is unavailable when the page is past the end
+        if skip:
+            total = await self.db.scalar(_COUNT_FILINGS)
+            return [], total
+        return [], 0
+
+    async def get_dashboard(self, limit: int = 10) -> Tuple[List[Filing], int]:
+        """Get the newest filings and the total count with concurrent queries
+
+        The filings load through self.db while the count runs in a second
+        session, so each call holds two pooled connections at once. The count
+        comes from a separate transaction: it can drift from the rows under
+        concurrent writes and does not see uncommitted writes in self.db.
+        """
+        engine = getattr(self.db, "bind", None)
+        if engine is None:
+            raise RuntimeError("Database not initialized. Call init_db() first.")
+        count_session_maker = async_sessionmaker(engine, **SESSION_OPTIONS)
+
+        async def newest() -> List[Filing]:
+            result = await self.db.execute(_LIST_FILINGS, {"skip": 0, "limit": limit})
+            return result.scalars().all()
+
+        async def total() -> int:
+            async with count_session_maker() as session:
+                return await session.scalar(_COUNT_FILINGS)
+
+        filings, count = await asyncio.gather(newest(), total())
+        return filings, count
+
     async def create_filing(self, filing_data: FilingCreate) -> Filing:
         """Create new filing"""
-        filing = Filing(**filing_data.dict())
+        filing = Filing(**filing_data.model_dump())
         self.db.add(filing)
         await self.db.commit()
-        await self.db.refresh(filing)
         return filing
 
     async def update_filing(self, filing_id: str, filing_data: FilingUpdate) -> Optional[Filing]:
@@ -36,12 +94,10 @@ class FilingService:
         if not filing:
             return None
 
-        update_data = filing_data.dict(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(filing, field, value)
+        for field in filing_data.model_fields_set:
+            setattr(filing, field, getattr(filing_data, field))
 
         await self.db.commit()
-        await self.db.refresh(filing)
         return filing
 
     async def delete_filing(self, filing_id: str) -> bool:
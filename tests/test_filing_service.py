@@ -0,0 +1,53 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.database import Base, SESSION_OPTIONS
+from app.models.filing import Filing
+from app.services.filing_service import FilingService
+
+pytest.importorskip("aiosqlite")
+
+
+async def _seed_and_fetch(url: str, limit: int):
+    engine = create_async_engine(url)
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        session_maker = async_sessionmaker(engine, **SESSION_OPTIONS)
+        async with session_maker() as session:
+            session.add_all([
+                Filing(
+                    filing_id=f"f{day}",
+                    company_name="Acme",
+                    form_type="10-K",
+                    filing_date=datetime(2024, 1, day),
+                )
+                for day in range(1, 4)
+            ])
+            await session.commit()
+
+            filings, total = await FilingService(session).get_dashboard(limit=limit)
+            return [filing.filing_id for filing in filings], total
+    finally:
+        await engine.dispose()
+
+
+def test_get_dashboard_returns_newest_filings_and_total(tmp_path):
+    url = f"sqlite+aiosqlite:///{tmp_path / 'filings.db'}"
+    filing_ids, total = asyncio.run(_seed_and_fetch(url, limit=2))
+
+    assert filing_ids == ["f3", "f2"]
+    assert total == 3
+
+
+def test_get_dashboard_requires_bound_session():
+    async def fetch():
+        async with AsyncSession() as session:
+            await FilingService(session).get_dashboard()
+
+    with pytest.raises(RuntimeError, match="Database not initialized"):
+        asyncio.run(fetch())